@@ -14,7 +14,7 @@ import sys
 __all__ = (
     'PY2', 'PY3',
     'string_types', 'integer_types', 'text_type', 'binary_type',
-    'range', 'with_metaclass'
+    'range', 'intern', 'with_metaclass'
 )
 
 PY2 = sys.version_info[0] == 2
@@ -27,6 +27,12 @@ if PY2:
     binary_type = str
 
     range = xrange
+
+    import __builtin__
+
+    def intern(value):
+        # Only byte strings (str) can be interned on Python 2
+        return __builtin__.intern(value) if isinstance(value, str) else value
 else:
     string_types = str,
     integer_types = int,
@@ -34,6 +40,8 @@ else:
     binary_type = bytes
     range = range
 
+    from sys import intern
+
 
 def with_metaclass(meta, *bases):
     """Create a base class with a metaclass."""
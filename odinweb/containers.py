@@ -10,6 +10,8 @@ from __future__ import absolute_import
 import collections
 import logging
 
+from operator import attrgetter
+
 from odin.codecs import json_codec
 from odin.exceptions import ValidationError
 from odin.utils import getmeta
@@ -46,6 +48,14 @@ try:
 except ImportError:
     pass
 
+CODEC_CACHE_SIZE = 64
+"""
+Maximum number of resolved content types cached by an API interface.
+"""
+
+
+_sort_key = attrgetter('sort_key')
+
 
 class ResourceApiMeta(type):
     """
@@ -54,15 +64,9 @@ class ResourceApiMeta(type):
     def __new__(mcs, name, bases, attrs):
         super_new = super(ResourceApiMeta, mcs).__new__
 
-        # attrs will never be empty for classes declared in the standard way
-        # (ie. with the `class` keyword). This is quite robust.
-        if name == 'NewBase' and attrs == {}:
-            return super_new(mcs, name, bases, attrs)
-
-        parents = [
-            b for b in bases
-            if isinstance(b, ResourceApiMeta) and not (b.__name__ == 'NewBase' and b.__mro__ == (b, object))
-        ]
+        # _compat.with_metaclass substitutes the real bases when the class is
+        # created so no intermediate base class needs to be filtered out.
+        parents = [b for b in bases if isinstance(b, ResourceApiMeta)]
         if not parents:
             # If this isn't a subclass of don't do anything special.
             return super_new(mcs, name, bases, attrs)
@@ -90,7 +94,13 @@ class ResourceApiMeta(type):
             if parent_ops:
                 operations.extend(parent_ops)
 
-        setattr(new_class, '_operations', sorted(operations, key=lambda o: o.sort_key))
+        operations.sort(key=_sort_key)
+        setattr(new_class, '_operations', operations)
+
+        # Resolve the default API name once rather than for every instance,
+        # only required if an API name has not been supplied.
+        if api_resource and not new_class.api_name:
+            setattr(new_class, '_default_api_name', getmeta(api_resource).name.lower())
 
         return new_class
 
@@ -121,9 +131,12 @@ class ResourceApi(_compat.with_metaclass(ResourceApiMeta)):
 
     parent = None
 
+    _default_api_name = None  # type: str
+
     def __init__(self):
         if not self.api_name:
-            self.api_name = getmeta(self.resource).name.lower()
+            # Fallback for APIs that assign their resource per instance
+            self.api_name = self._default_api_name or getmeta(self.resource).name.lower()
 
         # Append APIs name to path prefix
         self.path_prefix += self.api_name
@@ -233,7 +246,8 @@ class ApiInterfaceBase(ApiContainer):
     """
     registered_codecs = CODECS
     """
-    Codecs that are supported by this API.
+    Codecs that are supported by this API (resolved codecs are cached, see
+    :meth:`resolve_codec`).
     """
 
     request_type_resolvers = [
@@ -268,6 +282,7 @@ class ApiInterfaceBase(ApiContainer):
         self.middleware = MiddlewareList(options.pop('middleware', []))
         self.options = options.pop('options', True)
         super(ApiInterfaceBase, self).__init__(*containers, **options)
+        self._codec_cache = {}
 
         if not self.path_prefix.is_absolute:
             raise ValueError("Path prefix must be an absolute path (eg start with a '/')")
@@ -344,24 +359,46 @@ class ApiInterfaceBase(ApiContainer):
         else:
             return resource, None, None
 
+    def resolve_codec(self, content_type):
+        # type: (Optional[str]) -> Any
+        """
+        Resolve the codec for a content type (applying any remapping), returns
+        ``None`` if the content type is not supported.
+
+        Supported content types are cached as the same handful are seen on
+        almost every request. This means ``registered_codecs`` and
+        ``remap_codecs`` should be treated as frozen once the first request
+        has been dispatched; changes to a content type that has already been
+        resolved will not be seen. Unsupported types are not cached so codecs
+        registered later are still picked up.
+        """
+        codec_cache = self._codec_cache
+        try:
+            return codec_cache[content_type]
+        except KeyError:
+            pass
+
+        codec = self.registered_codecs.get(self.remap_codecs.get(content_type, content_type))
+        if codec is not None:
+            if len(codec_cache) >= CODEC_CACHE_SIZE:
+                codec_cache.clear()
+            codec_cache[content_type] = codec
+        return codec
+
     def _dispatch(self, operation, request, path_args):
         """
         Wrapped dispatch method, prepare request and generate a HTTP Response.
         """
         # Determine the request and response types. Ensure API supports the requested types
-        request_type = resolve_content_type(self.request_type_resolvers, request)
-        request_type = self.remap_codecs.get(request_type, request_type)
-        try:
-            request.request_codec = self.registered_codecs[request_type]
-        except KeyError:
+        request_codec = self.resolve_codec(resolve_content_type(self.request_type_resolvers, request))
+        if request_codec is None:
             return HttpResponse.from_status(HTTPStatus.UNPROCESSABLE_ENTITY)
+        request.request_codec = request_codec
 
-        response_type = resolve_content_type(self.response_type_resolvers, request)
-        response_type = self.remap_codecs.get(response_type, response_type)
-        try:
-            request.response_codec = self.registered_codecs[response_type]
-        except KeyError:
+        response_codec = self.resolve_codec(resolve_content_type(self.response_type_resolvers, request))
+        if response_codec is None:
             return HttpResponse.from_status(HTTPStatus.NOT_ACCEPTABLE)
+        request.response_codec = response_codec
 
         # Check if method is in our allowed method list
         if request.method not in operation.methods:
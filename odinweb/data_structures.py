@@ -3,6 +3,8 @@ from __future__ import absolute_import
 import abc
 import re
 
+from operator import itemgetter
+
 from odin.compatibility import deprecated
 from odin.utils import getmeta, lazy_property, force_tuple
 
@@ -290,7 +292,7 @@ class UrlPath(object):
 
                 nodes.append(PathParam(name, type_, param_arg))
             else:
-                nodes.append(node)
+                nodes.append(_compat.intern(node))
 
         return cls(*nodes)
 
@@ -675,10 +677,12 @@ class MultiValueDict(dict):
 
     """
     def __init__(self, mapping=None):
+        # Values are stored directly (in a single pass) without building an intermediate dict.
+        dict.__init__(self)
         if isinstance(mapping, MultiValueDict):
-            dict.__init__(self, ((k, l[:]) for k, l in mapping.lists()))
+            for key, values in iteritems(mapping):
+                dict.__setitem__(self, key, list(values))
         elif isinstance(mapping, dict):
-            tmp = {}
             for key, value in iteritems(mapping):
                 if isinstance(value, (tuple, list)):
                     if len(value) == 0:
@@ -686,13 +690,11 @@ class MultiValueDict(dict):
                     value = list(value)
                 else:
                     value = [value]
-                tmp[key] = value
-            dict.__init__(self, tmp)
+                dict.__setitem__(self, key, value)
         else:
-            tmp = {}
+            setdefault = dict.setdefault
             for key, value in mapping or ():
-                tmp.setdefault(key, []).append(value)
-            dict.__init__(self, tmp)
+                setdefault(self, key, []).append(value)
 
     def __getstate__(self):
         # type: () -> Dict[Hashable, List[Any]]
@@ -875,12 +877,13 @@ class MultiValueDict(dict):
                       contain pairs for the lasted added of each key.
 
         """
-        for key in sorted(dict.keys(self)):
+        # Sort the (key, values) pairs so values are in hand and no per key lookup is needed.
+        for key, values in sorted(iteritems(self), key=itemgetter(0)):
             if multi:
-                for value in self.getlist(key):
+                for value in values:
                     yield key, value
             else:
-                yield key, self[key]
+                yield key, values[-1]
 
     def lists(self):
         # type: () -> Iterator[Tuple[Hashable, List[Any]]]
@@ -21,7 +21,7 @@ def parse_content_type(value):
     if not value:
         return ''
 
-    return value.split(';')[0].strip()
+    return value.partition(';')[0].strip()
 
 
 def resolve_content_type(type_resolvers, request):
@@ -46,13 +46,14 @@ def get_resource(request, resource, allow_multiple=False, full_clean=True, defau
     body = request.body
     if isinstance(body, bytes):
         try:
-            body = body.decode('UTF8')
+            body = body.decode('utf-8')
         except UnicodeDecodeError as ude:
             raise HttpError(HTTPStatus.BAD_REQUEST, 99, "Unable to decode request body.", str(ude))
 
+    codec_loads = request.request_codec.loads
     try:
-        instance = request.request_codec.loads(body, resource=resource, full_clean=full_clean,
-                                               default_to_not_supplied=default_to_not_supplied)
+        instance = codec_loads(body, resource=resource, full_clean=full_clean,
+                               default_to_not_supplied=default_to_not_supplied)
 
     except ResourceException:
         raise HttpError(HTTPStatus.BAD_REQUEST, 98, "Invalid resource type.")
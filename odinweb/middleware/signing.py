@@ -6,7 +6,7 @@ from __future__ import absolute_import
 import logging
 
 # Typing imports
-from typing import Callable  # noqa
+from typing import Callable, Union  # noqa
 
 from .. import signing
 from ..exceptions import PermissionDenied, SigningError
@@ -21,7 +21,7 @@ class SignedAuthBase(object):
     priority = 3  # Ensure authentication run early
 
     def __init__(self, salt_arg='_', max_expiry=None, digest=None):
-        # type: (str, int, Callable) -> None
+        # type: (str, int, Union[str, Callable]) -> None
         self.salt_arg = salt_arg
         self.max_expiry = max_expiry
         self.digest = digest
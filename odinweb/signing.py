@@ -10,6 +10,7 @@ import base64
 import hashlib
 import hmac
 
+from functools import partial
 from odinweb.data_structures import MultiValueDict
 from time import time
 try:
@@ -19,42 +20,99 @@ except ImportError:
     from urlparse import parse_qs, urlparse
 
 # Type imports
-from typing import Callable, Dict  # noqa
+from typing import Callable, Dict, Tuple, Union  # noqa
 
 from . import _compat
 from .exceptions import SigningError
 from .utils import token
 
-DEFAULT_DIGEST = hashlib.sha256
+DEFAULT_DIGEST = 'sha256'
 DEFAULT_ENCODER = base64.b32encode
 
+HMAC_CACHE_SIZE = 128
+"""
+Maximum number of keyed HMAC objects held in the cache before it is reset.
+"""
+
+if _compat.PY2:
+    def _new_hmac(key, digest):
+        # type: (bytes, Union[str, Callable]) -> hmac.HMAC
+        if isinstance(digest, _compat.string_types):
+            digest = partial(hashlib.new, digest)
+        return hmac.new(key, digestmod=digest)
+else:
+    def _new_hmac(key, digest):
+        # type: (bytes, Union[str, Callable]) -> hmac.HMAC
+        return hmac.new(key, digestmod=digest)
+
+_hmac_cache = {}  # type: Dict[Tuple[bytes, Union[str, Callable]], hmac.HMAC]
+
+
+def _keyed_hmac(key, digest):
+    # type: (bytes, Union[str, Callable]) -> hmac.HMAC
+    """
+    Get a HMAC object seeded with a key.
+
+    These are cached (by key and digest) so the key padding is only calculated
+    once; messages should be applied to a copy.
+
+    """
+    cache_key = (key, digest)
+    try:
+        return _hmac_cache[cache_key]
+    except KeyError:
+        if len(_hmac_cache) >= HMAC_CACHE_SIZE:
+            _hmac_cache.clear()
+        keyed_hmac = _hmac_cache[cache_key] = _new_hmac(key, digest)
+        return keyed_hmac
+
+
+if _compat.PY2:
+    def _strip_padding(encoded):
+        # type: (str) -> str
+        return encoded.rstrip('=')
+else:
+    def _strip_padding(encoded):
+        # type: (bytes) -> str
+        return encoded.decode().rstrip('=')
+
+
+def _signature_message(url_path, query_args):
+    # type: (str, Dict[str, str]) -> bytes
+    """
+    Generate the canonical message that is signed from a pre-parsed URL.
+    """
+    msg = url_path + '?' + '&'.join(['%s=%s' % i for i in query_args.sorteditems(multi=True)])
+    return msg.encode('UTF8')
+
+
+def _sign_message(keyed_hmac, url_path, query_args, encoder=None):
+    # type: (hmac.HMAC, str, Dict[str, str], Callable) -> str
+    """
+    Generate an encoded signature from a pre-parsed URL using a keyed HMAC.
+    """
+    h = keyed_hmac.copy()
+    h.update(_signature_message(url_path, query_args))
+    return _strip_padding((encoder or DEFAULT_ENCODER)(h.digest()))
+
 
 def _generate_signature(url_path, secret_key, query_args, digest=None, encoder=None):
-    # type: (str, bytes, Dict[str, str], Callable, Callable) -> str
+    # type: (str, bytes, Dict[str, str], Union[str, Callable], Callable) -> str
     """
     Generate signature from pre-parsed URL.
     """
-    digest = digest or DEFAULT_DIGEST
-    encoder = encoder or DEFAULT_ENCODER
-    msg = "%s?%s" % (url_path, '&'.join('%s=%s' % i for i in query_args.sorteditems(multi=True)))
-    if _compat.text_type:
-        msg = msg.encode('UTF8')
-    signature = hmac.new(secret_key, msg, digestmod=digest).digest()
-    if _compat.PY2:
-        return encoder(signature).rstrip('=')  # Strip padding
-    else:
-        return encoder(signature).decode().rstrip('=')  # Strip padding
+    return _sign_message(_keyed_hmac(secret_key, digest or DEFAULT_DIGEST), url_path, query_args, encoder)
 
 
 def sign_url_path(url, secret_key, expire_in=None, digest=None):
-    # type: (str, bytes, int, Callable) -> str
+    # type: (str, bytes, int, Union[str, Callable]) -> str
     """
     Sign a URL (excluding the domain and scheme).
 
     :param url: URL to sign
     :param secret_key: Secret key
     :param expire_in: Expiry time.
-    :param digest: Specify the digest function to use; default is sha256 from hashlib
+    :param digest: Specify the digest name or function to use; default is sha256
     :return: Signed URL
 
     """
@@ -64,23 +122,14 @@ def sign_url_path(url, secret_key, expire_in=None, digest=None):
     if expire_in is not None:
         query_args['expires'] = int(time() + expire_in)
     query_args['signature'] = _generate_signature(result.path, secret_key, query_args, digest)
-    return "%s?%s" % (result.path, urlencode(list(query_args.sorteditems(True))))
+    # urlencode requires a sequence (it calls len()), so the pairs are materialised once here.
+    return result.path + '?' + urlencode(list(query_args.sorteditems(True)))
 
 
-def verify_url_path(url_path, query_args, secret_key, salt_arg='_', max_expiry=None, digest=None):
-    # type: (str, Dict[str, str], bytes, str, int, Callable) -> bool
+def _pop_signature(query_args, salt_arg='_'):
+    # type: (Dict[str, str], str) -> str
     """
-    Verify a URL path is correctly signed.
-
-    :param url_path: URL path
-    :param secret_key: Signing key
-    :param query_args: Arguments that make up the query string
-    :param salt_arg: Argument required for salt (set to None to disable)
-    :param max_expiry: Maximum length of time an expiry value can be for (set to None to disable)
-    :param digest: Specify the digest function to use; default is sha256 from hashlib
-    :rtype: bool
-    :raises: URLError
-
+    Pop the supplied signature from the query args and ensure a salt was used.
     """
     try:
         supplied_signature = query_args.pop('signature')
@@ -90,19 +139,20 @@ def verify_url_path(url_path, query_args, secret_key, salt_arg='_', max_expiry=N
     if salt_arg is not None and salt_arg not in query_args:
         raise SigningError("No salt used.")
 
-    if max_expiry is not None and 'expires' not in query_args:
-        raise SigningError("Expiry time is required.")
+    return supplied_signature
 
-    # Validate signature
-    signature = _generate_signature(url_path, secret_key, query_args, digest)
-    if not hmac.compare_digest(signature, supplied_signature):
-        raise SigningError('Signature not valid.')
 
-    # Check expiry
+def _check_expiry(query_args, max_expiry=None):
+    # type: (Dict[str, str], int) -> None
+    """
+    Check the expiry time of a signed URL; the expiry value is left in the
+    query args as it forms part of the signature.
+    """
     try:
-        expiry_time = int(query_args.pop('expires'))
+        expiry_time = int(query_args['expires'])
     except KeyError:
-        pass  # URL doesn't have an expire time
+        if max_expiry is not None:
+            raise SigningError("Expiry time is required.")
     except ValueError:
         raise SigningError("Invalid expiry value.")
     else:
@@ -112,6 +162,33 @@ def verify_url_path(url_path, query_args, secret_key, salt_arg='_', max_expiry=N
         if max_expiry and expiry_delta > max_expiry:
             raise SigningError("Expiry time out of range.")
 
+
+def verify_url_path(url_path, query_args, secret_key, salt_arg='_', max_expiry=None, digest=None):
+    # type: (str, Dict[str, str], bytes, str, int, Union[str, Callable]) -> bool
+    """
+    Verify a URL path is correctly signed.
+
+    :param url_path: URL path
+    :param secret_key: Signing key
+    :param query_args: Arguments that make up the query string
+    :param salt_arg: Argument required for salt (set to None to disable)
+    :param max_expiry: Maximum length of time an expiry value can be for (set to None to disable)
+    :param digest: Specify the digest name or function to use; default is sha256
+    :rtype: bool
+    :raises: URLError
+
+    """
+    supplied_signature = _pop_signature(query_args, salt_arg)
+
+    # Check expiry before generating the signature so expired URLs don't incur the HMAC cost
+    _check_expiry(query_args, max_expiry)
+
+    # Validate signature
+    signature = _generate_signature(url_path, secret_key, query_args, digest)
+    if not hmac.compare_digest(signature, supplied_signature):
+        raise SigningError('Signature not valid.')
+
+    query_args.pop('expires', None)
     return True
 
 
@@ -128,3 +205,38 @@ def verify_url(url, secret_key, **kwargs):
     result = urlparse(url)
     query_args = MultiValueDict(parse_qs(result.query))
     return verify_url_path(result.path, query_args, secret_key, **kwargs)
+
+
+def make_verifier(secret_key, salt_arg='_', max_expiry=None, digest=None):
+    # type: (bytes, str, int, Union[str, Callable]) -> Callable[[str], bool]
+    """
+    Make a function that verifies signed URLs (excluding the domain and scheme)
+    for a fixed secret key and set of options.
+
+    This is the preferred API where many URLs are verified with the same key;
+    the keyed HMAC is prepared once instead of on each call.
+
+    :param secret_key: Signing key
+    :param salt_arg: Argument required for salt (set to None to disable)
+    :param max_expiry: Maximum length of time an expiry value can be for (set to None to disable)
+    :param digest: Specify the digest name or function to use; default is sha256
+    :return: Function that accepts a URL and returns `True` or raises :class:`SigningError`
+
+    """
+    keyed_hmac = _new_hmac(secret_key, digest or DEFAULT_DIGEST)
+
+    def verify(url):
+        # type: (str) -> bool
+        result = urlparse(url)
+        query_args = MultiValueDict(parse_qs(result.query))
+
+        supplied_signature = _pop_signature(query_args, salt_arg)
+        _check_expiry(query_args, max_expiry)
+
+        signature = _sign_message(keyed_hmac, result.path, query_args)
+        if not hmac.compare_digest(signature, supplied_signature):
+            raise SigningError('Signature not valid.')
+
+        return True
+
+    return verify
@@ -15,7 +15,12 @@ To enable add the :py:class:`SwaggerSpec` resource API into your API::
 
 """
 import collections
+import operator
 import os
+import zlib
+
+from functools import reduce
+from weakref import WeakKeyDictionary
 
 from odin import fields
 from odin.fields.virtual import VirtualField
@@ -23,7 +28,6 @@ from odin.utils import getmeta, lazy_property, force_tuple
 
 from . import doc
 from . import resources
-from ._compat import binary_type
 from .constants import HTTPStatus, Type as SwaggerType
 from .containers import ResourceApi, CODECS
 from .data_structures import UrlPath, Param, HttpResponse, NoPath, DefaultResource
@@ -33,6 +37,7 @@ from .utils import dict_filter
 
 # Imported for typing support
 from typing import List, Dict, Any, Union, Tuple, Type  # noqa
+from odin import Resource  # noqa
 from .data_structures import PathParam  # noqa
 
 try:
@@ -52,7 +57,8 @@ SWAGGER_SPEC_TYPE_MAPPING = [
     (fields.BooleanField, SwaggerType.Boolean),
 ]  # type: List[Tuple[Type[fields.Field], SwaggerType]]
 """
-Mapping of fields to Swagger types.
+Mapping of fields to Swagger types (frozen on first use, see
+:func:`map_field_to_type`).
 """
 
 if future:
@@ -61,11 +67,61 @@ if future:
     )
 
 
+STATIC_CONTENT_TYPES = {
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+}
+"""
+Content types of static files that can be served (by extension).
+"""
+
+
+SWAGGER_CACHE_SIZE = 16
+"""
+Maximum number of encoded swagger documents (per host/codec) cached by a spec.
+"""
+
+
+def gzip_compress(data, level=9):
+    # type: (bytes, int) -> bytes
+    """
+    Compress data into the gzip format (used for ``Content-Encoding: gzip``).
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return compressor.compress(data) + compressor.flush()
+
+
+_field_types = {}  # type: Dict[Type[fields.Field], SwaggerType]
+
+
 def map_field_to_type(field):
     # type: (Any) -> SwaggerType
+    """
+    Map a field to a Swagger type.
+
+    The result is cached per field class so ``SWAGGER_SPEC_TYPE_MAPPING`` is
+    only scanned the first time a class is seen. This means the mapping
+    should be treated as frozen once it is first used (resource definitions
+    are cached as well); extend it at import time.
+    """
+    field_class = field.__class__
+    try:
+        return _field_types[field_class]
+    except KeyError:
+        pass
+
     for field_type, type_ in SWAGGER_SPEC_TYPE_MAPPING:
         if isinstance(field, field_type):
-            return type_
+            break
+    else:
+        type_ = None
+
+    _field_types[field_class] = type_
+    return type_
+
+
+_choice_value = operator.itemgetter(0)
+_resource_definitions = WeakKeyDictionary()  # type: Dict[Type[Resource], Dict[str, Any]]
 
 
 def resource_definition(resource):
@@ -73,12 +129,22 @@ def resource_definition(resource):
     Generate a `Swagger Definitions Object <http://swagger.io/specification/#definitionsObject>`_
     from a resource.
 
+    Definitions are cached per resource as the fields of a resource do not
+    change; the returned dict is shared so should not be modified.
+
     """
+    try:
+        return _resource_definitions[resource]
+    except KeyError:
+        pass
+
     meta = getmeta(resource)
+    readonly_fields = set(meta.readonly_fields)
 
+    properties = {}
     definition = {
         'type': "object",
-        'properties': {}
+        'properties': properties
     }
 
     for field in meta.all_fields:
@@ -93,18 +159,36 @@ def resource_definition(resource):
         if field.doc_text:
             field_definition['description'] = field.doc_text
 
-        if isinstance(field, VirtualField) or field in meta.readonly_fields:
+        if isinstance(field, VirtualField) or field in readonly_fields:
             field_definition['readOnly'] = True
 
         # Use getattr to support calculated fields
         if getattr(field, 'choices', None):
-            field_definition['enum'] = [c[0] for c in field.choices]
+            field_definition['enum'] = list(map(_choice_value, field.choices))
 
-        definition['properties'][field.name] = field_definition
+        properties[field.name] = field_definition
 
+    _resource_definitions[resource] = definition
     return definition
 
 
+_path_parameters = {}  # type: Dict[Tuple[str, SwaggerType], Dict[str, Any]]
+
+
+def _path_parameter(name, type_):
+    # type: (str, SwaggerType) -> Dict[str, Any]
+    """
+    Swagger definition of a path parameter; the same parameters are repeated
+    across many paths so definitions are shared.
+    """
+    key = (name, type_)
+    try:
+        return _path_parameters[key]
+    except KeyError:
+        parameter = _path_parameters[key] = Param.path(name, type_).to_swagger()
+        return parameter
+
+
 class SwaggerSpec(ResourceApi):
     """
     Resource API instance that generates a Swagger spec of the current API.
@@ -129,45 +213,50 @@ class SwaggerSpec(ResourceApi):
         self.enabled = enabled
         self.enable_ui = enabled and enable_ui
         self.host = host
-        self.schemes = set(force_tuple(schemes or ()))
+        self.schemes = tuple(sorted(set(force_tuple(schemes or ()))))
 
         self._ui_cache = None
+        self._static_cache = {}  # type: Dict[str, bytes]
+        self._spec_cache = None  # type: Dict[str, Any]
+        self._encoded_spec_cache = {}  # type: Dict[Tuple[str, Any], str]
 
     @lazy_property
-    def cenancestor(self):
+    def ancestors(self):
+        # type: () -> List[Any]
         """
-        Last universal ancestor (or the top level of the API structure).
+        Containers this API is nested within (nearest first).
         """
-        ancestor = parent = self.parent
+        ancestors = []
+        parent = self.parent
         while parent:
-            ancestor = parent
+            ancestors.append(parent)
             parent = getattr(parent, 'parent', None)
-        return ancestor
+        return ancestors
+
+    @lazy_property
+    def cenancestor(self):
+        """
+        Last universal ancestor (or the top level of the API structure).
+        """
+        ancestors = self.ancestors
+        return ancestors[-1] if ancestors else None
 
     @lazy_property
     def base_path(self):
         """
         Calculate the APIs base path
         """
-        path = UrlPath()
+        prefixes = [getattr(parent, 'path_prefix', NoPath) for parent in reversed(self.ancestors)]
+        return reduce(operator.add, prefixes) if prefixes else UrlPath()
 
-        # Walk up the API to find the base object
-        parent = self.parent
-        while parent:
-            path_prefix = getattr(parent, 'path_prefix', NoPath)
-            path = path_prefix + path
-            parent = getattr(parent, 'parent', None)
-
-        return path
-
-    @property
+    @lazy_property
     def swagger_path(self):
         return self.base_path + 'swagger'
 
     @staticmethod
     def generate_parameters(path):
         # type: (UrlPath) -> List[Dict[str, Any]]
-        return [Param.path(node.name, node.type).to_swagger() for node in path.path_nodes]
+        return [_path_parameter(node.name, node.type) for node in path.path_nodes]
 
     @staticmethod
     def swagger_node_formatter(path_node):
@@ -175,7 +264,7 @@ class SwaggerSpec(ResourceApi):
         """
         Format a node for swagger spec (default formatter for the format method).
         """
-        return "{{{}}}".format(path_node.name)
+        return '{' + path_node.name + '}'
 
     def security_definitions(self):
         """
@@ -192,10 +281,11 @@ class SwaggerSpec(ResourceApi):
             getmeta(resources.Listing).resource_name: resource_definition(resources.Listing),
         }
 
+        node_formatter = self.swagger_node_formatter
         paths = collections.OrderedDict()
         for path, operation in self.parent.op_paths():
             # Cut of first item (will be the parents path)
-            path = '/' + path[1:]  # type: UrlPath
+            path = path[1:]  # type: UrlPath
 
             # Filter out swagger endpoints
             if self.SWAGGER_TAG in operation.tags:
@@ -216,56 +306,109 @@ class SwaggerSpec(ResourceApi):
                         if resource_name not in resource_defs:
                             resource_defs[resource_name] = resource_definition(resource)
 
-            # Add path parameters
-            path_spec = paths.setdefault(path.format(self.swagger_node_formatter), {})
-
-            # Add parameters
-            parameters = self.generate_parameters(path)
-            if parameters:
-                path_spec['parameters'] = parameters
+            # Add path, parameters are only generated the first time a path is seen
+            path_key = '/' + path.format(node_formatter)
+            path_spec = paths.get(path_key)
+            if path_spec is None:
+                path_spec = paths[path_key] = {}
+                parameters = self.generate_parameters(path)
+                if parameters:
+                    path_spec['parameters'] = parameters
 
             # Add methods
+            operation_spec = operation.to_swagger()
             for method in operation.methods:
-                path_spec[method.value.lower()] = operation.to_swagger()
+                path_spec[method.value.lower()] = operation_spec
 
         return paths, resource_defs
 
+    def swagger_document(self, host):
+        # type: (str) -> Dict[str, Any]
+        """
+        Generate the swagger document of this API for a particular host.
+        """
+        # The API structure is fixed once defined so the host independent
+        # document is only generated once, the host is filled in per request.
+        spec = self._spec_cache
+        if spec is None:
+            api_base = self.parent
+            paths, definitions = self.parse_operations()
+            codecs = getattr(self.cenancestor, 'registered_codecs', CODECS)  # type: dict
+            content_types = list(codecs)
+            spec = self._spec_cache = dict_filter({
+                'swagger': '2.0',
+                'info': {
+                    'title': self.title,
+                    'version': str(getattr(api_base, 'version', 0))
+                },
+                'schemes': list(self.schemes) or None,
+                'basePath': str(self.base_path),
+                'consumes': content_types,
+                'produces': content_types,
+                'paths': paths,
+                'definitions': definitions,
+                'securityDefinitions': self.security_definitions(),
+            })
+
+        return dict(spec, host=host) if host else spec
+
     @doc.response(HTTPStatus.OK, "Swagger JSON of this API")
     def get_swagger(self, request):
         """
         Generate this document.
         """
-        api_base = self.parent
-        paths, definitions = self.parse_operations()
-        codecs = getattr(self.cenancestor, 'registered_codecs', CODECS)  # type: dict
-        return dict_filter({
-            'swagger': '2.0',
-            'info': {
-                'title': self.title,
-                'version': str(getattr(api_base, 'version', 0))
-            },
-            'host': self.host or request.host,
-            'schemes': list(self.schemes) or None,
-            'basePath': str(self.base_path),
-            'consumes': list(codecs.keys()),
-            'produces': list(codecs.keys()),
-            'paths': paths,
-            'definitions': definitions,
-            'securityDefinitions': self.security_definitions(),
+        # Document is encoded once for each host/codec combination. The host
+        # can be supplied by the client so the number of entries is bounded.
+        codec = request.response_codec
+        cache_key = (self.host or request.host, codec)
+        encoded_cache = self._encoded_spec_cache
+        try:
+            body = encoded_cache[cache_key]
+        except KeyError:
+            body = codec.dumps(self.swagger_document(cache_key[0]))
+            if len(encoded_cache) >= SWAGGER_CACHE_SIZE:
+                encoded_cache.clear()
+            encoded_cache[cache_key] = body
+
+        return HttpResponse(body, headers={
+            'Content-Type': codec.CONTENT_TYPE
         })
 
+    @lazy_property
+    def static_files(self):
+        """
+        Names of the files available in the static folder.
+        """
+        return frozenset(os.listdir(self.static_path))
+
     def load_static(self, file_name):
-        file_path = os.path.abspath(os.path.join(self.static_path, file_name))
-        # This is a security check to ensure this is not abused to
-        # read files outside of the static folder.
-        if not file_path.startswith(self.static_path):
+        try:
+            return self._static_cache[file_name]
+        except KeyError:
+            pass
+
+        # This is a security check to ensure this is not abused to read files
+        # outside of the static folder; only known file names are accepted.
+        try:
+            static_files = self.static_files
+        except OSError:
+            raise HttpError(HTTPStatus.NOT_FOUND, 42)
+        if file_name not in static_files:
             raise HttpError(HTTPStatus.NOT_FOUND, 42)
 
+        # Read the file in a single unbuffered read of its known size.
         try:
-            return open(file_path, 'rb').read()
-        except IOError:
+            fd = os.open(os.path.join(self.static_path, file_name), os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                content = os.read(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+        except (IOError, OSError):
             raise HttpError(HTTPStatus.NOT_FOUND, 42)
 
+        self._static_cache[file_name] = content
+        return content
+
     @doc.response(HTTPStatus.OK, "HTML content")
     @doc.produces('text/html')
     def get_ui(self, _):
@@ -273,12 +416,15 @@ class SwaggerSpec(ResourceApi):
         Load the Swagger UI interface
         """
         if not self._ui_cache:
-            content = self.load_static('ui.html')
-            if isinstance(content, binary_type):
-                content = content.decode('UTF-8')
-            self._ui_cache = content.replace(u"{{SWAGGER_PATH}}", str(self.swagger_path))
+            # Substitute the path directly into the raw bytes (no decode/encode required).
+            parts = self.load_static('ui.html').split(b"{{SWAGGER_PATH}}")
+            content = str(self.swagger_path).encode('UTF-8').join(parts)
+            # Compressed once as the content does not change.
+            self._ui_cache = gzip_compress(content)
         return HttpResponse(self._ui_cache, headers={
-            'Content-Type': 'text/html'
+            'Content-Type': 'text/html',
+            'Content-Encoding': 'gzip',
+            'Cache-Control': 'public, max-age=300',
         })
 
     @doc.response(HTTPStatus.OK, "HTML content")
@@ -286,10 +432,7 @@ class SwaggerSpec(ResourceApi):
         """
         Get static content for UI.
         """
-        content_type = {
-            'ss': 'text/css',
-            'js': 'application/javascript',
-        }.get(file_name[-2:])
+        content_type = STATIC_CONTENT_TYPES.get(os.path.splitext(file_name)[1])
         if not content_type:
             raise HttpError(HTTPStatus.NOT_FOUND, 42)
 
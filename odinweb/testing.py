@@ -7,27 +7,147 @@ Collection of Mocks and Tools for testing APIs.
 """
 from __future__ import absolute_import
 
-from collections import MutableMapping
+import re
+
 # Imports to support typing
-from typing import Dict, Any  # noqa
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union  # noqa
 
 from odin.codecs import json_codec
 try:
-    from urllib.parse import urlparse, parse_qs
+    from urllib.parse import parse_qsl
 except ImportError:
-    from urlparse import urlparse, parse_qs
+    from urlparse import parse_qsl
 
+from ._compat import intern
 from .constants import Method
 from .data_structures import MultiValueDict, BaseHttpRequest
 
 # Typing
 from .decorators import Operation  # noqa
 
+Query = Union[Dict[str, Any], Iterable[Tuple[str, Any]]]
+
+
+HEADER_KEY_CACHE_SIZE = 512
+"""
+Maximum number of normalised keys held in the cache before it is reset.
+"""
+
+_header_keys = {}  # type: Dict[str, str]
+
+
+def _normalise_key(key):
+    # type: (str) -> str
+    """
+    Normalise a header/environ key (eg Content-Type -> CONTENT_TYPE).
+
+    The vocabulary of keys is small and repetitive so results are cached.
+    """
+    try:
+        return _header_keys[key]
+    except KeyError:
+        if len(_header_keys) >= HEADER_KEY_CACHE_SIZE:
+            _header_keys.clear()
+        # Keys that are already in the canonical form are used as is (only
+        # exact strings, subclasses are converted so the result can be interned).
+        if type(key) is str and key.isupper() and '-' not in key:
+            normalised = key
+        else:
+            normalised = key.upper().replace('-', '_')
+        # Interned so every request shares the same key objects.
+        normalised = _header_keys[key] = intern(normalised)
+        return normalised
+
+
+SCHEME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*$')
+"""
+Valid URI scheme (RFC 3986).
+"""
+
+
+def _split_uri(uri):
+    # type: (str) -> Tuple[str, str, str, str]
+    """
+    Split a URI into scheme, netloc, path and query (any fragment or path
+    parameters are discarded).
+
+    A simplified alternative to ``urlparse`` for the URIs used to mock requests.
+    """
+    uri, _, query = uri.partition('#')[0].partition('?')
+
+    scheme, sep, rest = uri.partition('://')
+    if sep and SCHEME_RE.match(scheme):
+        scheme = scheme.lower()
+        netloc, sep, path = rest.partition('/')
+        path = sep + path
+    elif uri.startswith('//'):
+        scheme = ''
+        netloc, sep, path = uri[2:].partition('/')
+        path = sep + path
+    else:
+        scheme = netloc = ''
+        path = uri
+
+    # As with urlparse parameters are only split from the last path segment
+    params = path.find(';', path.rfind('/') + 1)
+    if params >= 0:
+        path = path[:params]
+
+    return scheme, netloc, path, query
+
+
+def _prepare_mapping(pairs=None):
+    # type: (Iterable[Tuple[str, Any]]) -> MultiValueDict
+    return MultiValueDict((_normalise_key(k), v) for k, v in pairs or ())
 
-def _prepare_mapping(mapping=None):
-    # type: (dict) -> MultiValueDict
-    mapping = mapping or {}
-    return MultiValueDict((k.upper().replace('-', '_'), v) for k, v in mapping.items())
+
+def _prepare_multi_value(mapping=None):
+    # type: (Query) -> MultiValueDict
+    return MultiValueDict(mapping or {})
+
+
+def _copy_items(mapping):
+    # type: (Optional[Dict[str, Any]]) -> Optional[List[Tuple[str, Any]]]
+    """
+    Shallow copy of a header/environ mapping (any object with ``items``) as
+    key/value pairs so changes made by the caller afterwards are not
+    reflected in the request.
+    """
+    if not mapping:
+        return None
+    return list(mapping.items())
+
+
+def _copy_multi_value(value):
+    # type: (Optional[Query]) -> Optional[Query]
+    """
+    Shallow copy of a mapping (or sequence of pairs) supplied to a request so
+    changes made by the caller afterwards are not reflected in the request.
+    """
+    if not value:
+        return None
+    if isinstance(value, MultiValueDict):
+        return value.copy()
+    return dict(value) if isinstance(value, dict) else list(value)
+
+
+def _lazy_mapping(name, prepare):
+    """
+    Property that prepares a mapping from the raw value supplied to the
+    request the first time it is accessed.
+    """
+    attr = '_' + name
+    raw_attr = '_raw_' + name
+
+    def getter(self):
+        value = getattr(self, attr)
+        if value is None:
+            value = prepare(getattr(self, raw_attr))
+            setattr(self, attr, value)
+            setattr(self, raw_attr, None)
+        return value
+
+    return property(getter)
 
 
 class MockRequest(BaseHttpRequest):
@@ -36,37 +156,43 @@ class MockRequest(BaseHttpRequest):
 
     This can be treated as a template of a request
     """
+    __slots__ = ('_environ', '_method', '_scheme', '_host', '_path', '_query', '_headers', '_cookies', '_session',
+                 '_body', '_form', 'request_codec', 'response_codec', 'current_operation',
+                 '_raw_environ', '_raw_query', '_raw_headers', '_raw_cookies', '_raw_session', '_raw_form')
+
     @classmethod
     def from_uri(cls, uri, headers=None, method=Method.GET, body='', form=None, environ=None,
                  cookies=None, session=None, request_codec=None, response_codec=None, current_operation=None):
         # type: (str, dict, Method, str, dict, dict, dict, Any, Any, Operation) -> MockRequest
-        scheme, netloc, path, _, query, _ = urlparse(uri)
-        return cls(scheme, netloc, path, parse_qs(query), headers, method, body, form,
+        scheme, netloc, path, query = _split_uri(uri)
+        # Query pairs are passed straight through to the MultiValueDict (no intermediate dict of lists).
+        return cls(scheme, netloc, path, parse_qsl(query), headers, method, body, form,
                    environ, cookies, session, request_codec, response_codec, current_operation)
 
     def __init__(self, scheme='http', host='127.0.0.1', path=None, query=None, headers=None,
                  method=Method.GET, body='', form=None, environ=None, cookies=None, session=None,
                  request_codec=None, response_codec=None, current_operation=None):
-        # type: (str, str, str, dict, dict, Method, str, dict, dict, dict, dict, Any, Any, Operation) -> None
-        self._environ = _prepare_mapping(environ)
+        # type: (str, str, str, Query, dict, Method, str, dict, dict, dict, dict, Any, Any, Operation) -> None
         self._method = method
         self._scheme = scheme
         self._host = host
         self._path = path or ''
-        self._query = MultiValueDict(query or {})
-        self._headers = _prepare_mapping(headers)
-        self._cookies = MultiValueDict(cookies or {})
-        self._session = MultiValueDict(session or {})
         self._body = body
-        self._form = MultiValueDict(form or {})
+
+        # Mappings are prepared on first access (from a copy of the input)
+        self._environ = self._query = self._headers = self._cookies = self._session = self._form = None
+        self._raw_environ = _copy_items(environ)
+        self._raw_query = _copy_multi_value(query)
+        self._raw_headers = _copy_items(headers)
+        self._raw_cookies = _copy_multi_value(cookies)
+        self._raw_session = _copy_multi_value(session)
+        self._raw_form = _copy_multi_value(form)
 
         self.request_codec = request_codec or json_codec
         self.response_codec = response_codec or json_codec
         self.current_operation = current_operation
 
-    @property
-    def environ(self):
-        return self._environ
+    environ = _lazy_mapping('environ', _prepare_mapping)
 
     @property
     def method(self):
@@ -84,26 +210,16 @@ class MockRequest(BaseHttpRequest):
     def path(self):
         return self._path
 
-    @property
-    def query(self):
-        return self._query
+    query = _lazy_mapping('query', _prepare_multi_value)
 
-    @property
-    def headers(self):
-        return self._headers
+    headers = _lazy_mapping('headers', _prepare_mapping)
 
-    @property
-    def cookies(self):
-        return self._cookies
+    cookies = _lazy_mapping('cookies', _prepare_multi_value)
 
-    @property
-    def session(self):
-        return self._session
+    session = _lazy_mapping('session', _prepare_multi_value)
 
     @property
     def body(self):
         return self._body
 
-    @property
-    def form(self):
-        return self._form
+    form = _lazy_mapping('form', _prepare_multi_value)
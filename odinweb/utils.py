@@ -9,12 +9,12 @@ from __future__ import absolute_import
 
 import os
 import base64
-import itertools
 
 # Typing imports
 from typing import Any  # noqa
 
 from . import _compat
+from ._compat import string_types
 
 
 if _compat.PY2:
@@ -22,6 +22,10 @@ if _compat.PY2:
         """
         Generate a random token of a certain bit depth and strip any padding.
         """
+        if bit_depth == 64:
+            # Fast path for the default depth
+            return encoder(os.urandom(8)).rstrip('=')
+
         # Fast divide by 8 ;)
         chars = bit_depth >> 3
         if bit_depth == chars << 3:
@@ -32,21 +36,32 @@ else:
         """
         Generate a random token of a certain bit depth and strip any padding.
         """
+        if bit_depth == 64:
+            # Fast path for the default depth
+            return encoder(os.urandom(8)).decode('ascii').rstrip('=')
+
         # Fast divide by 8 ;)
         chars = bit_depth >> 3
         if bit_depth == chars << 3:
             data = os.urandom(chars)
-            return encoder(data).decode().rstrip('=')
+            return encoder(data).decode('ascii').rstrip('=')
         raise ValueError("Bit depth must be a multiple of 8")
 
 
+TRUTHY_STRINGS = frozenset(('Y', 'YES', 'T', 'TRUE', '1', 'OK'))
+"""
+Strings (in upper case) that are considered `True` by :func:`to_bool`.
+"""
+
+
 def to_bool(value):
     # type: (Any) -> bool
     """
     Convert a value into a bool but handle "truthy" strings eg, yes, true, ok, y
     """
-    if isinstance(value, _compat.string_types):
-        return value.upper() in ('Y', 'YES', 'T', 'TRUE', '1', 'OK')
+    if isinstance(value, string_types):
+        # Skip upper casing strings that are too long to be truthy.
+        return len(value) <= 4 and value.upper() in TRUTHY_STRINGS
     return bool(value)
 
 
@@ -55,7 +70,10 @@ def dict_filter_update(base, updates):
     """
     Update dict with None values filtered out.
     """
-    base.update((k, v) for k, v in updates.items() if v is not None)
+    # A plain loop avoids the generator frame dict.update would consume.
+    for key, value in updates.items():
+        if value is not None:
+            base[key] = value
 
 
 def dict_filter(*args, **kwargs):
@@ -63,8 +81,10 @@ def dict_filter(*args, **kwargs):
     Merge all values into a single dict with all None values removed.
     """
     result = {}
-    for arg in itertools.chain(args, (kwargs,)):
+    for arg in args:
         dict_filter_update(result, arg)
+    if kwargs:
+        dict_filter_update(result, kwargs)
     return result
 
 
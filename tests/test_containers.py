@@ -3,6 +3,7 @@ from __future__ import absolute_import
 import pytest
 from odinweb.resources import Error
 
+from odin.codecs import json_codec
 from odin.exceptions import ValidationError
 from odinweb import api
 from odinweb import containers
@@ -64,17 +65,17 @@ class MockApiInterface(containers.ApiInterfaceBase):
 # Tests
 
 class TestResourceApiMeta(object):
-    def test_empty_api(self, mocker):
+    @pytest.fixture(autouse=True)
+    def reset_operation_count(self, mocker):
         mocker.patch('odinweb.decorators.Operation._operation_count', 0)
 
+    def test_empty_api(self):
         class ExampleApi(api.ResourceApi):
             pass
 
         assert ExampleApi._operations == []
 
-    def test_normal_api(self, mocker):
-        mocker.patch('odinweb.decorators.Operation._operation_count', 0)
-
+    def test_normal_api(self):
         class ExampleApi(api.ResourceApi):
             @api.collection
             def list_items(self, request):
@@ -94,9 +95,7 @@ class TestResourceApiMeta(object):
             Operation(mock_callback, NoPath, (Method.POST, Method.PUT)),
         ]
 
-    def test_sub_classed_api(self, mocker):
-        mocker.patch('odinweb.decorators.Operation._operation_count', 0)
-
+    def test_sub_classed_api(self):
         class SuperApi(api.ResourceApi):
             @api.collection
             def list_items(self, request):
@@ -133,16 +132,39 @@ class TestResourceApi(object):
 
         assert target.api_name == 'users'
 
+    def test_api_name__resolved_on_class(self):
+        assert UserApi._default_api_name == 'user'
+
+    def test_api_name__instance_resource(self):
+        class Example(api.ResourceApi):
+            def __init__(self):
+                self.resource = User
+                super(Example, self).__init__()
+
+        target = Example()
+
+        assert target.api_name == 'user'
+
+    def test_api_name__custom_without_resource_meta(self):
+        class Example(api.ResourceApi):
+            resource = object
+            api_name = 'things'
+
+        target = Example()
+
+        assert Example._default_api_name is None
+        assert target.api_name == 'things'
+
     def test_op_paths(self):
         target = UserApi()
 
-        actual = dict(target.op_paths(NoPath))
+        actual = list(target.op_paths(NoPath))
 
-        assert actual == {
-            UrlPath.parse('user'): Operation(mock_callback, NoPath, methods=Method.GET),
-            UrlPath.parse('user/{resource_id}'): Operation(mock_callback, '{resource_id}', methods=Method.GET),
-            UrlPath.parse('user/start'): Operation(mock_callback, 'start', methods=Method.POST),
-        }
+        assert actual == [
+            (UrlPath.parse('user'), Operation(mock_callback, NoPath, methods=Method.GET)),
+            (UrlPath.parse('user/{resource_id}'), Operation(mock_callback, '{resource_id}', methods=Method.GET)),
+            (UrlPath.parse('user/start'), Operation(mock_callback, 'start', methods=Method.POST)),
+        ]
 
 
 class TestApiContainer(object):
@@ -156,7 +178,6 @@ class TestApiContainer(object):
     def test_options(self, options, attr, value):
         target = containers.ApiContainer(**options)
 
-        assert hasattr(target, attr)
         assert getattr(target, attr) == value
 
     def test_extra_option(self):
@@ -169,24 +190,24 @@ class TestApiContainer(object):
     def test_op_paths(self):
         target = containers.ApiContainer(MockResourceApi())
 
-        actual = dict(target.op_paths('c'))
+        actual = list(target.op_paths('c'))
 
-        assert actual == {
-            UrlPath.parse('c/a/b'): Operation(mock_callback, 'a/b', Method.GET),
-            UrlPath.parse('c/a/b'): Operation(mock_callback, 'a/b', Method.POST),
-            UrlPath.parse('c/d/e'): Operation(mock_callback, 'd/e', (Method.POST, Method.PATCH)),
-        }
+        assert actual == [
+            (UrlPath.parse('c/a/b'), Operation(mock_callback, 'a/b', Method.GET)),
+            (UrlPath.parse('c/a/b'), Operation(mock_callback, 'a/b', Method.POST)),
+            (UrlPath.parse('c/d/e'), Operation(mock_callback, 'd/e', (Method.POST, Method.PATCH))),
+        ]
 
     def test_op_paths__no_sub_path(self):
         target = containers.ApiContainer(MockResourceApi())
 
-        actual = dict(target.op_paths())
+        actual = list(target.op_paths())
 
-        assert actual == {
-            UrlPath.parse('a/b'): Operation(mock_callback, 'a/b', Method.GET),
-            UrlPath.parse('a/b'): Operation(mock_callback, 'a/b', Method.POST),
-            UrlPath.parse('d/e'): Operation(mock_callback, 'd/e', (Method.POST, Method.PATCH)),
-        }
+        assert actual == [
+            (UrlPath.parse('a/b'), Operation(mock_callback, 'a/b', Method.GET)),
+            (UrlPath.parse('a/b'), Operation(mock_callback, 'a/b', Method.POST)),
+            (UrlPath.parse('d/e'), Operation(mock_callback, 'd/e', (Method.POST, Method.PATCH))),
+        ]
 
 
 class TestApiCollection(object):
@@ -212,12 +233,12 @@ class TestApiCollection(object):
         def my_operation(request):
             pass
 
-        actual = dict(target.op_paths())
+        actual = list(target.op_paths())
 
         assert len(actual) == 1
-        assert actual == {
-            UrlPath.parse("a/b"): Operation(mock_callback, 'a/b')
-        }
+        assert actual == [
+            (UrlPath.parse("a/b"), Operation(mock_callback, 'a/b')),
+        ]
 
 
 class TestApiInterfaceBase(object):
@@ -238,6 +259,30 @@ class TestApiInterfaceBase(object):
         with pytest.raises(ValueError):
             containers.ApiInterfaceBase(path_prefix='ab/c')
 
+    @pytest.mark.parametrize('content_type, expected', (
+        ('application/json', 'application/json'),
+        ('text/plain', 'application/json'),
+        ('application/xml', None),
+        (None, None),
+    ))
+    def test_resolve_codec(self, content_type, expected):
+        target = containers.ApiInterfaceBase()
+
+        actual = target.resolve_codec(content_type)
+
+        assert (actual and actual.CONTENT_TYPE) == expected
+        assert target._codec_cache.get(content_type) is actual
+
+    def test_resolve_codec__registered_later(self, monkeypatch):
+        target = containers.ApiInterfaceBase()
+        monkeypatch.setattr(target, 'registered_codecs', dict(target.registered_codecs))
+
+        assert target.resolve_codec('application/xml') is None
+
+        target.registered_codecs['application/xml'] = json_codec
+
+        assert target.resolve_codec('application/xml') is json_codec
+
     def test_dispatch(self):
         pass
 
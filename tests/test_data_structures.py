@@ -111,6 +111,12 @@ class TestUrlPath(object):
         target = UrlPath.parse(path)
         assert target._nodes == expected
 
+    def test_parse__nodes_shared(self):
+        a = UrlPath.parse(''.join(['/api', '/v1']))
+        b = UrlPath.parse('/api/v1/user')
+
+        assert all(x is y for x, y in zip(a._nodes, b._nodes))
+
     @pytest.mark.parametrize('path', (
         'a/{b/c',
         'a/b}/c',
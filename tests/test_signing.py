@@ -1,4 +1,6 @@
 import base64
+import hashlib
+import hmac
 import pytest
 
 try:
@@ -27,6 +29,10 @@ def url_compare(a, b):
 @pytest.mark.parametrize('url_path, kwargs, expected', (
     ('/foo/bar', {},
      "XC6FH5OSR5KORFNMP4RGI5XVUJNYYKUL5VL374LP5E6LU4F2N66Q"),
+    ('/foo/bar', {'digest': hashlib.sha256},
+     "XC6FH5OSR5KORFNMP4RGI5XVUJNYYKUL5VL374LP5E6LU4F2N66Q"),
+    ('/foo/bar', {'digest': 'sha256'},
+     "XC6FH5OSR5KORFNMP4RGI5XVUJNYYKUL5VL374LP5E6LU4F2N66Q"),
     ('/foo/bar', {'encoder': base64.b16encode},
      "B8BC53F5D28F54E895AC7F226476F5A25B8C2A8BED57BFF16FE93CBA70BA6FBD"),
     ('/foo/bar', {'query_args': {'a': ['1'], 'b': ['2']}},
@@ -41,6 +47,18 @@ def test_generate_signature(url_path, kwargs, expected):
     assert actual == expected
 
 
+def test_keyed_hmac__cached_key(monkeypatch):
+    monkeypatch.setattr(signing, '_hmac_cache', {})
+    monkeypatch.setattr(signing, 'HMAC_CACHE_SIZE', 1)
+
+    for key in (b'abc', b'abc', b'def'):
+        h = signing._keyed_hmac(key, 'sha256').copy()
+        h.update(b'/foo/bar')
+        assert h.digest() == hmac.new(key, b'/foo/bar', hashlib.sha256).digest()
+
+    assert list(signing._hmac_cache) == [(b'def', 'sha256')]
+
+
 @pytest.mark.parametrize('url, kwargs, expected', (
     ('/foo/bar', {},
      "/foo/bar?_=YJEYWGBKGUVZS&signature=QKUNPLEDOMFVU2NBTEASPR2J4B524KFMG4GMW2NJISVG2RQQVJEA"),
@@ -77,6 +95,30 @@ def test_verify_url_path(monkeypatch, url, kwargs):
     assert signing.verify_url(url, **kwargs)
 
 
+@pytest.mark.parametrize('url, kwargs', (
+    ("/foo/bar?_=YJEYWGBKGUVZS&signature=QKUNPLEDOMFVU2NBTEASPR2J4B524KFMG4GMW2NJISVG2RQQVJEA", {}),
+    ("/foo/bar?a=1&b=2&expires=1020&_=YJEYWGBKGUVZS&signature=XRKDRGPSUXFQUG36CNSOFY6RSWJFYSKTUOORJIQUUDG4WBCZOKUA", {}),
+    ("/foo/bar?a=1&b=2&expires=1020&_=YJEYWGBKGUVZS&signature=XRKDRGPSUXFQUG36CNSOFY6RSWJFYSKTUOORJIQUUDG4WBCZOKUA",
+     {'digest': hashlib.sha256}),
+    ("/foo/bar?_=YJEYWGBKGUVZS&signature=QKUNPLEDOMFVU2NBTEASPR2J4B524KFMG4GMW2NJISVG2RQQVJED", {}),
+    ("/foo/bar?a=1&b=2&expires=1020&_=YJEYWGBKGUVZS&signature=XRKDRGPSUXFQUG36CNSOFY6RSWJFYSKTUOORJIQUUDG4WBCZOKUA",
+     {'max_expiry': 1}),
+))
+def test_make_verifier(monkeypatch, url, kwargs):
+    monkeypatch.setattr(signing, 'time', lambda: 1010)
+
+    verify = signing.make_verifier(base64.b32decode('DEADBEEF'), **kwargs)
+
+    try:
+        expected = signing.verify_url(url, base64.b32decode('DEADBEEF'), **kwargs)
+    except SigningError as ex:
+        with pytest.raises(SigningError) as result:
+            verify(url)
+        assert str(result.value) == str(ex)
+    else:
+        assert verify(url) == expected
+
+
 @pytest.mark.parametrize('url, kwargs', (
     # Signature missing
     ("/foo/bar?_=YJEYWGBKGUVZS", {}),
@@ -103,15 +145,14 @@ def test_verify_url_path__error_cases(monkeypatch, url, kwargs):
         signing.verify_url(url, **kwargs)
 
 
+def test_verify_url_path__expiry_checked_before_signature(monkeypatch):
+    def generate_signature(*_, **__):
+        raise AssertionError("Signature should not be generated")
 
+    monkeypatch.setattr(signing, '_generate_signature', generate_signature)
+    monkeypatch.setattr(signing, 'time', lambda: 1010)
 
+    with pytest.raises(SigningError) as result:
+        signing.verify_url("/foo/bar?signature=INVALID&expires=1005&_=YJEYWGBKGUVZS", base64.b32decode('DEADBEEF'))
 
-
-
-
-
-
-
-
-
-
+    assert str(result.value) == "Signature has expired."
@@ -1,5 +1,9 @@
+import json
+import os
 import pytest
+import zlib
 
+from odin import fields
 from odinweb import swagger, _compat
 from odinweb.constants import Type, HTTPStatus, Method
 from odinweb.containers import ApiInterfaceBase, ApiContainer, ApiVersion
@@ -11,6 +15,28 @@ from odinweb.testing import MockRequest
 from .resources import User, Group
 
 
+class UpperStringField(fields.StringField):
+    pass
+
+
+@pytest.mark.parametrize('field, expected', (
+    (fields.IntegerField(), Type.Long),
+    (fields.EmailField(), Type.Email),
+    (fields.StringField(), Type.String),
+    (UpperStringField(), Type.String),
+    (fields.DictField(), None),
+))
+def test_map_field_to_type(field, expected):
+    assert swagger.map_field_to_type(field) == expected
+
+
+def test_map_field_to_type__cached_unknown_type():
+    # The second lookup is answered from the cache (including a None result).
+    assert swagger.map_field_to_type(fields.DictField()) is None
+    assert fields.DictField in swagger._field_types
+    assert swagger.map_field_to_type(fields.DictField()) is None
+
+
 class TestResourceDefinition:
     def test_basic_definition(self):
         actual = swagger.resource_definition(User)
@@ -25,6 +51,9 @@ class TestResourceDefinition:
             }
         }
 
+    def test_definition_is_cached(self):
+        assert swagger.resource_definition(User) is swagger.resource_definition(User)
+
     def test_with_calculated_field(self):
         actual = swagger.resource_definition(Group)
 
@@ -40,13 +69,14 @@ class TestResourceDefinition:
 
 class TestSwaggerSpec(object):
     @pytest.mark.parametrize('options, title, enabled, enable_ui, host, schemes', (
-        ({'title': 'Test'}, 'Test', True, False, None, set()),
-        ({'title': 'Test', 'enabled': False}, 'Test', False, False, None, set()),
-        ({'title': 'Test', 'enable_ui': True}, 'Test', True, True, None, set()),
-        ({'title': 'Test', 'enabled': False, 'enable_ui': True}, 'Test', False, False, None, set()),
-        ({'title': 'Test', 'host': 'localhost'}, 'Test', True, False, 'localhost', set()),
-        ({'title': 'Test', 'schemes': ('http', 'https')}, 'Test', True, False, None, {'http', 'https'}),
-        ({'title': 'Test', 'schemes': 'http'}, 'Test', True, False, None, {'http'}),
+        ({'title': 'Test'}, 'Test', True, False, None, ()),
+        ({'title': 'Test', 'enabled': False}, 'Test', False, False, None, ()),
+        ({'title': 'Test', 'enable_ui': True}, 'Test', True, True, None, ()),
+        ({'title': 'Test', 'enabled': False, 'enable_ui': True}, 'Test', False, False, None, ()),
+        ({'title': 'Test', 'host': 'localhost'}, 'Test', True, False, 'localhost', ()),
+        ({'title': 'Test', 'schemes': ('http', 'https')}, 'Test', True, False, None, ('http', 'https')),
+        ({'title': 'Test', 'schemes': 'http'}, 'Test', True, False, None, ('http',)),
+        ({'title': 'Test', 'schemes': ('https', 'http', 'https')}, 'Test', True, False, None, ('http', 'https')),
     ))
     def test_configure(self, options, title, enabled, enable_ui, host, schemes):
         target = swagger.SwaggerSpec(**options)
@@ -163,6 +193,9 @@ class TestSwaggerSpec(object):
         base.registered_codecs['application/yaml'] = None  # Only the keys are used.
 
         actual = target.get_swagger(request)
+        assert actual['Content-Type'] == 'application/json'
+
+        actual = json.loads(actual.body)
         expected = {
             'swagger': '2.0',
             'info': {
@@ -224,6 +257,46 @@ class TestSwaggerSpec(object):
         }
         assert actual == expected
 
+    def test_get_swagger__cached_per_host(self, monkeypatch):
+        target = swagger.SwaggerSpec("Example")
+        ApiInterfaceBase(ApiVersion(target))
+
+        calls = []
+        parse_operations = target.parse_operations
+        monkeypatch.setattr(target, 'parse_operations', lambda: calls.append(1) or parse_operations())
+
+        first = target.swagger_document('a.example.com')
+        second = target.swagger_document('b.example.com')
+
+        assert first['host'] == 'a.example.com'
+        assert second['host'] == 'b.example.com'
+        assert second['paths'] is first['paths']
+        assert len(calls) == 1
+        assert 'host' not in target.swagger_document(None)
+
+    def test_get_swagger__encoded_once(self, monkeypatch):
+        target = swagger.SwaggerSpec("Example")
+        ApiInterfaceBase(ApiVersion(target))
+
+        first = target.get_swagger(MockRequest())
+        monkeypatch.setattr(target, 'swagger_document', None)
+        second = target.get_swagger(MockRequest())
+
+        assert first is not second
+        assert first.body is second.body
+        assert json.loads(second.body)['host'] == '127.0.0.1'
+
+    def test_get_swagger__encoded_cache_bounded(self, monkeypatch):
+        monkeypatch.setattr(swagger, 'SWAGGER_CACHE_SIZE', 2)
+        target = swagger.SwaggerSpec("Example")
+        ApiInterfaceBase(ApiVersion(target))
+
+        for host in ('a.example.com', 'b.example.com', 'c.example.com'):
+            actual = target.get_swagger(MockRequest(host=host))
+            assert json.loads(actual.body)['host'] == host
+
+        assert len(target._encoded_spec_cache) <= 2
+
     def test_load_static(self):
         target = swagger.SwaggerSpec("", enable_ui=True)
 
@@ -233,6 +306,22 @@ class TestSwaggerSpec(object):
         else:
             assert actual.startswith(b'<!DOCTYPE html>')
 
+    def test_load_static__cached(self):
+        target = swagger.SwaggerSpec("", enable_ui=True)
+
+        assert target.load_static('ui.css') is target.load_static('ui.css')
+
+    def test_load_static__missing_static_path(self):
+        class ExampleSpec(swagger.SwaggerSpec):
+            static_path = os.path.join(os.path.dirname(__file__), 'does-not-exist')
+
+        target = ExampleSpec("", enable_ui=True)
+
+        with pytest.raises(HttpError) as result:
+            target.load_static('ui.html')
+
+        assert result.value.status == HTTPStatus.NOT_FOUND
+
     def test_load_static__not_found_if_not_found(self):
         target = swagger.SwaggerSpec("")
 
@@ -254,9 +343,10 @@ class TestSwaggerSpec(object):
 
         actual = target.get_ui(None)
 
-        assert actual.body.startswith("<!DOCTYPE html>")
+        assert zlib.decompress(actual.body, zlib.MAX_WBITS | 16).startswith(b"<!DOCTYPE html>")
         assert actual.status == HTTPStatus.OK
         assert actual['Content-Type'] == 'text/html'
+        assert actual['Content-Encoding'] == 'gzip'
 
     @pytest.mark.parametrize('file_name, content_type', (
         ("ui.css", 'text/css'),
@@ -272,10 +362,11 @@ class TestSwaggerSpec(object):
         assert actual['Content-Type'] == content_type
         assert actual['Content-Encoding'] == 'gzip'
 
-    def test_get_static__not_found_if_unknown_content_type(self):
+    @pytest.mark.parametrize('file_name', ('ui.html', 'ui.ss', 'js'))
+    def test_get_static__not_found_if_unknown_content_type(self, file_name):
         target = swagger.SwaggerSpec("")
 
         with pytest.raises(HttpError) as ex:
-            target.get_static(None, 'ui.html')
+            target.get_static(None, file_name)
 
         assert ex.value.status == HTTPStatus.NOT_FOUND
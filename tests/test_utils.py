@@ -34,6 +34,8 @@ class TestToken(object):
     ('1', True),
     ('0', False),
     ('OK', True),
+    ('ok', True),
+    ('Truee', False),
     (1, True),
     (0, False),
     (True, True),